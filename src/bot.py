@@ -1,10 +1,13 @@
 import discord
 from discord.ext import commands, tasks
 from discord import app_commands
+import asyncio
 import datetime
+import heapq
 import os
 import json
-import pandas as pd
+import tempfile
+import numpy as np
 from pytz import timezone
 from dotenv import load_dotenv
 import io
@@ -23,20 +26,61 @@ import plotly.graph_objects as go
 import plotly.express as px
 from plotly.subplots import make_subplots
 
+from ranking import top_k_indices, bottom_k_indices
+
+# Use orjson for (de)serialization when it's installed; it is several times faster than the stdlib json module.
+try:
+    import orjson
+
+    def json_loads(content):
+        return orjson.loads(content)
+
+    def json_dumps(data) -> bytes:
+        return orjson.dumps(data)
+except ImportError:
+    def json_loads(content):
+        return json.loads(content)
+
+    def json_dumps(data) -> bytes:
+        return json.dumps(data).encode()
+
+# Function to read and parse a JSON file.
+def read_json(path):
+    with open(path, "rb") as f:
+        return json_loads(f.read())
+
+# Function to serialize data to a JSON file.  Writes to a temporary file and renames it over the target so a crash mid-write can't leave a truncated file behind.
+# Each call gets its own temp file, so concurrent writers to the same path can't clobber each other's partial output.
+def write_json(path, data):
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(json_dumps(data))
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+# Parse a JSON file, memoized on its modification time so repeat reads of an unchanged file skip the disk and the parse.
+# Callers share the returned object and must not mutate it.
+@lru_cache(maxsize=4)
+def _load_json_cached(path, mtime):
+    return read_json(path)
+
+# Function to load the latest leaderboard, re-parsing only when the backend has rewritten the file.  Callers that
+# already stat'ed the file can pass its mtime so the cache key matches what they checked.
+def load_leaderboard(mtime=None):
+    if mtime is None:
+        mtime = os.path.getmtime(LEADERBOARD_LATEST)
+    return _load_json_cached(LEADERBOARD_LATEST, mtime)
 
 # Asynchronous function to load leaderboard data from the latest JSON file.  Handles file not found and other exceptions.
 async def load_leaderboard_data() -> Optional[Dict[str, Any]]:
     try:
         if not os.path.exists(LEADERBOARD_LATEST):
             return None
-
-        try:
-            async with aiofiles.open(LEADERBOARD_LATEST, mode='r') as f:
-                content = await f.read()
-                return json.loads(content)
-        except ImportError:
-            with open(LEADERBOARD_LATEST, 'r') as f:
-                return json.load(f)
+        return await asyncio.to_thread(load_leaderboard)
     except Exception as e:
         print(f"Error loading leaderboard data: {e}")
         return None
@@ -65,91 +109,186 @@ if not DISCORD_BOT_TOKEN:
     print("Error: DISCORD_BOT_TOKEN is not set in the environment variables.")
     exit(1)
 
+# Get the leaderboard and stocks channel IDs from environment variables.  Exit if either is missing or not a number.
+try:
+    LEADERBOARD_CHANNEL_ID = int(os.environ["DISCORD_CHANNEL_ID_Leaderboard"])
+    STOCKS_CHANNEL_ID = int(os.environ["DISCORD_CHANNEL_ID_Stocks"])
+except (KeyError, ValueError) as e:
+    print(f"Error: invalid or missing Discord channel ID in the environment variables: {e}")
+    exit(1)
+
 # Initialize the Discord bot with command prefix '$' and intents.
 bot = commands.Bot(command_prefix="$", intents=intents)
+
+# Channels the bot posts to.  Resolved once in on_ready since the channel IDs never change.
+bot.leaderboard_channel = None
+bot.stocks_channel = None
 print("Bot initialized with command prefix '$'")
 
 # Define time zones for Eastern and Pacific Standard Time.
 EST = timezone('US/Eastern')
 PST = timezone('America/Los_Angeles')
 
-# Function to extract and format user information from a Pandas DataFrame.
-def get_user_info(df, username):
-    df["Money In Account"] = pd.to_numeric(df["Money In Account"], errors="coerce")
-    user_row = df[df["Account Name"] == username]
-    if user_row.empty:
+# Market hours in Eastern time, and the first/last minute of the session that always trigger a leaderboard update.
+MARKET_OPEN = datetime.time(9, 30)
+MARKET_CLOSE = datetime.time(16, 0)
+MARKET_OPEN_MINUTE_END = datetime.time(9, 31)
+MARKET_CLOSE_MINUTE_START = datetime.time(15, 59)
+
+# Function to format a user's holdings as one "SYMBOL: quantity (value)" line per stock.
+def format_holdings(user_stocks):
+    return "\n".join(f"{stock[0]}: {stock[1]} ({stock[2]})" for stock in user_stocks)
+
+# Function to extract and format user information from the leaderboard data.  Each record is [money, link, stocks].
+def get_user_info(data, username):
+    if username not in data:
         return None
-    user_data = user_row.iloc[0]
-    user_name = user_data["Account Name"]
-    user_money = user_data["Money In Account"]
-    user_stocks = user_data["Stocks Invested In"]
-    formatted_holdings = "\n".join(
-        [f"{stock[0]}: {stock[1]} ({stock[2]})" for stock in user_stocks]
-    )
-    return user_name, user_money, formatted_holdings
+    user_data = data[username]
+    return username, float(user_data[0]), format_holdings(user_data[2])
+
+# Function to get the (username, record) pairs of the richest users, highest first.
+def get_top_users(data, count=5):
+    return heapq.nlargest(count, data.items(), key=lambda item: float(item[1][0]))
+
+# Function to build the leaderboard embed description from the top users.
+def format_top_users(top_users):
+    parts = []
+    for idx, (username, record) in enumerate(top_users, 1):
+        money = float(record[0])
+        parts.append(f"**#{idx} - {username}**\n")
+        parts.append(f"Money: ${money:,.2f}\n\n")
+    return "".join(parts)
 
 # Function to get the path to the latest leaderboard file in the 'in_time' directory.
 def get_latest_in_time_leaderboard():
-    files = [f for f in os.listdir(IN_TIME_DIR) if f.endswith(".json")]
-    if not files:
-        return None
-    files.sort(key=lambda x: parse_leaderboard_timestamp(x))
-    latest_file = files[-1]
-    return os.path.join(IN_TIME_DIR, latest_file)
+    with os.scandir(IN_TIME_DIR) as entries:
+        latest = max(
+            (entry for entry in entries if entry.name.endswith(".json")),
+            key=lambda entry: parse_leaderboard_timestamp(entry.name),
+            default=None,
+        )
+    return latest.path if latest else None
 
 # Helper function to get the current time in PST.
 def get_pst_time():
     return datetime.datetime.now(PST)
 
+# Stock symbols each user held as of the last stock snapshot.  Kept across ticks so the snapshot is parsed only once.
+_prev_symbol_sets: Dict[str, frozenset] = {}
+
+# Modification time of the leaderboard file the last time its stock changes were processed.
+_last_seen_mtime = 0.0
+
+# Function to get the set of stock symbols held in a leaderboard record.
+def get_symbol_set(record):
+    return frozenset(stock[0] for stock in record[2])
+
+# Discord limits a message to 10 embeds and 6000 characters across all of their titles, descriptions, fields and footers.
+MAX_EMBEDS_PER_MESSAGE = 10
+MAX_EMBED_CHARS_PER_MESSAGE = 6000
+
+# Function to split embeds into consecutive batches that each fit in a single Discord message.
+def batch_embeds(embeds):
+    batch = []
+    batch_chars = 0
+    for embed in embeds:
+        embed_chars = len(embed)
+        if batch and (
+            len(batch) == MAX_EMBEDS_PER_MESSAGE
+            or batch_chars + embed_chars > MAX_EMBED_CHARS_PER_MESSAGE
+        ):
+            yield batch
+            batch = []
+            batch_chars = 0
+        batch.append(embed)
+        batch_chars += embed_chars
+    if batch:
+        yield batch
+
 # Asynchronous function to compare stock holdings between the current and previous leaderboards and send updates to Discord.
 async def compare_stock_changes(channel):
+    global _last_seen_mtime
     try:
-        with open(LEADERBOARD_LATEST, "r") as f:
-            current_data = json.load(f)
+        # Nothing to diff if the backend hasn't rewritten the leaderboard since the last run.
+        mtime = os.path.getmtime(LEADERBOARD_LATEST)
+        if mtime <= _last_seen_mtime:
+            return
+
+        current_data = await asyncio.to_thread(load_leaderboard, mtime)
 
         snapshot_path = SNAPSHOT_PATH
-        if os.path.exists(snapshot_path):
-            with open(snapshot_path, "r") as f:
-                previous_data = json.load(f)
-
-            for username in current_data:
-                if username not in previous_data:
-                    continue
-
-                current_stocks = set(stock[0] for stock in current_data[username][2])
-                previous_stocks = set(stock[0] for stock in previous_data[username][2])
-
-                new_stocks = current_stocks - previous_stocks
-                removed_stocks = previous_stocks - current_stocks
-
-                if new_stocks or removed_stocks:
-                    description = ""
-                    for stock in new_stocks:
-                        description += f"+ Bought {stock}\n"
-                    for stock in removed_stocks:
-                        description += f"- Sold {stock}\n"
-
-                    embed = discord.Embed(
-                        colour=discord.Colour.green(),
-                        title=f"Stock Changes for {username}",
-                        description=description,
-                        timestamp=get_pst_time(),
-                    )
-                    stock_channel = bot.get_channel(int(os.environ.get("DISCORD_CHANNEL_ID_Stocks")))
-                    if stock_channel:
-                        await stock_channel.send(embed=embed)
+        if not _prev_symbol_sets and os.path.exists(snapshot_path):
+            previous_data = await asyncio.to_thread(read_json, snapshot_path)
+            _prev_symbol_sets.update(
+                (username, get_symbol_set(record)) for username, record in previous_data.items()
+            )
+
+        # Only rewrite the snapshot when it is missing, a holding changed, or users joined/left.
+        snapshot_dirty = current_data.keys() != _prev_symbol_sets.keys()
+        pending_embeds = []
+        # New symbol sets for users whose holdings changed.  Only merged into the cache once the embeds are sent and the
+        # snapshot is written, so a failed send or write leaves the changes to be reported again on the next tick.
+        changed_symbol_sets = {}
+
+        for username, record in current_data.items():
+            previous_stocks = _prev_symbol_sets.get(username)
+            if previous_stocks is None:
+                continue
+
+            current_stocks = get_symbol_set(record)
+            if current_stocks == previous_stocks:
+                continue
+
+            snapshot_dirty = True
+            changed_symbol_sets[username] = current_stocks
+
+            new_stocks = current_stocks - previous_stocks
+            removed_stocks = previous_stocks - current_stocks
+
+            parts = [f"+ Bought {stock}\n" for stock in new_stocks]
+            parts.extend(f"- Sold {stock}\n" for stock in removed_stocks)
+            description = "".join(parts)
+
+            pending_embeds.append(discord.Embed(
+                colour=discord.Colour.green(),
+                title=f"Stock Changes for {username}",
+                description=description,
+                timestamp=get_pst_time(),
+            ))
+
+        # Send the changes in as few messages as Discord allows rather than one message per user.
+        stock_channel = bot.stocks_channel
+        if stock_channel:
+            for batch in batch_embeds(pending_embeds):
+                await stock_channel.send(embeds=batch)
+
+        if snapshot_dirty:
+            await asyncio.to_thread(write_json, snapshot_path, current_data)
+            _prev_symbol_sets.update(changed_symbol_sets)
+            for username in _prev_symbol_sets.keys() - current_data.keys():
+                del _prev_symbol_sets[username]
+            for username in current_data.keys() - _prev_symbol_sets.keys():
+                _prev_symbol_sets[username] = get_symbol_set(current_data[username])
 
-        with open(snapshot_path, "w") as f:
-            json.dump(current_data, f)
+        # Only mark this version as processed once it was fully handled, so any failure above retries it next tick.
+        _last_seen_mtime = mtime
 
     except Exception as e:
         await channel.send(f"Error comparing stock changes: {str(e)}")
         import traceback
         traceback.print_exc()
 
-# Load usernames from the usernames file.
-with open(USERNAMES_PATH, "r") as f:
-    usernames_list = [line.strip() for line in f.readlines()]
+# Load usernames from the usernames file, each paired with its lowercase form so autocomplete doesn't re-lower the list on every keystroke.
+# Memoized on the file's modification time, so edits are picked up without restarting the bot.
+@lru_cache(maxsize=1)
+def _load_usernames(mtime):
+    with open(USERNAMES_PATH, "r") as f:
+        usernames = [line.strip() for line in f]
+    return tuple((username, username.lower()) for username in usernames if username)
+
+# Function to get the current (username, lowercase username) pairs.
+def get_usernames():
+    return _load_usernames(os.path.getmtime(USERNAMES_PATH))
 
 # Function to parse the timestamp from a leaderboard filename.
 def parse_leaderboard_timestamp(filename):
@@ -191,8 +330,7 @@ def generate_money_graph(username):
         data = {'timestamp': [], username: []}
         for file in files:
             try:
-                with open(file.path) as f:
-                    file_data = json.load(f)
+                file_data = read_json(file.path)
                 if username in file_data:
                     timestamp = parse_leaderboard_timestamp(file.name)
                     if timestamp.tzinfo is None:
@@ -332,18 +470,8 @@ class UserInfo(commands.Cog):
             return
 
         try:
-            with open(LEADERBOARD_LATEST, "r") as file:
-                data = json.load(file)
-            df = pd.DataFrame.from_dict(data, orient="index")
-            df.reset_index(inplace=True)
-            df.columns = [
-                "Account Name",
-                "Money In Account",
-                "Investopedia Link",
-                "Stocks Invested In",
-            ]
-
-            user_info = get_user_info(df, username)
+            data = await asyncio.to_thread(load_leaderboard)
+            user_info = get_user_info(data, username)
             if user_info is None:
                 await interaction.followup.send(f"User '{username}' not found.")
                 return
@@ -360,7 +488,7 @@ class UserInfo(commands.Cog):
             )
 
             try:
-                graph_buffer, lowest_value, highest_value = generate_money_graph(username)
+                graph_buffer, lowest_value, highest_value = await asyncio.to_thread(generate_money_graph, username)
                 if graph_buffer:
                     file = discord.File(graph_buffer, filename="money_graph.png")
                     embed.set_image(url="attachment://money_graph.png")
@@ -391,11 +519,15 @@ class UserInfo(commands.Cog):
     async def username_autocomplete(
         self, interaction: discord.Interaction, current: str
     ):
-        return [
-            app_commands.Choice(name=username, value=username)
-            for username in usernames_list
-            if current.lower() in username.lower()
-        ][:25]
+        current_lower = current.lower()
+        choices = []
+        for username, username_lower in get_usernames():
+            if current_lower in username_lower:
+                choices.append(app_commands.Choice(name=username, value=username))
+                # Discord accepts at most 25 autocomplete choices.
+                if len(choices) == 25:
+                    break
+        return choices
 
 # Function to add the UserInfo cog to the bot.
 async def setup(bot):
@@ -416,7 +548,7 @@ def generate_leaderboard_graph(top_users_data):
     if not files:
         return None
 
-    usernames = top_users_data['Account Name'].tolist()
+    usernames = [username for username, _ in top_users_data]
 
     data = {
         'timestamp': [],
@@ -425,8 +557,7 @@ def generate_leaderboard_graph(top_users_data):
 
     for file in files:
         try:
-            with open(file.path) as f:
-                file_data = json.load(f)
+            file_data = read_json(file.path)
             timestamp = parse_leaderboard_timestamp(file.name)
             data['timestamp'].append(timestamp)
             for username in usernames:
@@ -497,18 +628,8 @@ async def leaderboard(interaction: discord.Interaction):
             await interaction.followup.send("Error loading leaderboard data")
             return
 
-        df = pd.DataFrame.from_dict(current_data, orient="index")
-        df.reset_index(inplace=True)
-        df.columns = ["Account Name", "Money In Account", "Investopedia Link", "Stocks Invested In"]
-        df.sort_values(by="Money In Account", ascending=False, inplace=True)
-
-        top_users = df.head(5)
-        description = ""
-        for idx, row in enumerate(top_users.iterrows(), 1):
-            _, row = row
-            money = float(row['Money In Account'])
-            description += f"**#{idx} - {row['Account Name']}**\n"
-            description += f"Money: ${money:,.2f}\n\n"
+        top_users = get_top_users(current_data)
+        description = format_top_users(top_users)
 
         embed = discord.Embed(
             colour=get_embed_color(),
@@ -517,7 +638,7 @@ async def leaderboard(interaction: discord.Interaction):
             timestamp=get_pst_time(),
         )
 
-        graph_buffer = generate_leaderboard_graph(top_users)
+        graph_buffer = await asyncio.to_thread(generate_leaderboard_graph, top_users)
         if graph_buffer:
             file = discord.File(graph_buffer, filename="leaderboard_graph.png")
             embed.set_image(url="attachment://leaderboard_graph.png")
@@ -529,25 +650,13 @@ async def leaderboard(interaction: discord.Interaction):
         print(f"Error in leaderboard command: {str(e)}")
         await interaction.followup.send(f"Error fetching leaderboard: {str(e)}")
 
-#Function to compare previous and current leaderboard data to determine if the top 5 rankings have changed.
-def have_rankings_changed(previous_data, current_data):
-    if not previous_data or not current_data:
+#Function to compare the previous leaderboard's top 5 against the already-computed current top 5 to determine if the rankings have changed.
+def have_rankings_changed(previous_data, current_top_users):
+    if not previous_data or not current_top_users:
         return True
 
-    prev_rankings = sorted(
-        [(name, float(data[0])) for name, data in previous_data.items()],
-        key=lambda x: x[1],
-        reverse=True
-    )[:5]
-
-    curr_rankings = sorted(
-        [(name, float(data[0])) for name, data in current_data.items()],
-        key=lambda x: x[1],
-        reverse=True
-    )[:5]
-
-    prev_names = [name for name, _ in prev_rankings]
-    curr_names = [name for name, _ in curr_rankings]
+    prev_names = [name for name, _ in get_top_users(previous_data)]
+    curr_names = [name for name, _ in current_top_users]
 
     return prev_names != curr_names
 
@@ -559,10 +668,8 @@ async def send_leaderboard():
         if now.weekday() >= 5:
             return
 
-        market_open = now.replace(hour=9, minute=30, second=0, microsecond=0)
-        market_close = now.replace(hour=16, minute=0, second=0, microsecond=0)
-
-        if not (market_open <= now <= market_close):
+        now_time = now.time()
+        if not (MARKET_OPEN <= now_time <= MARKET_CLOSE):
             return
 
         current_data = await load_leaderboard_data()
@@ -572,16 +679,17 @@ async def send_leaderboard():
         snapshot_path = SNAPSHOT_PATH
         previous_data = None
         if os.path.exists(snapshot_path):
-            async with aiofiles.open(snapshot_path, 'r') as f:
+            async with aiofiles.open(snapshot_path, 'rb') as f:
                 content = await f.read()
-                previous_data = json.loads(content)
+                previous_data = json_loads(content)
 
-        is_market_open = abs((now - market_open).total_seconds()) < 60
-        is_market_close = abs((now - market_close).total_seconds()) < 60
-        rankings_changed = have_rankings_changed(previous_data, current_data)
+        is_market_open = now_time < MARKET_OPEN_MINUTE_END
+        is_market_close = now_time > MARKET_CLOSE_MINUTE_START
+        top_users = get_top_users(current_data)
+        rankings_changed = have_rankings_changed(previous_data, top_users)
 
         if is_market_open or is_market_close or rankings_changed:
-            leaderboard_channel = bot.get_channel(int(os.environ.get("DISCORD_CHANNEL_ID_Leaderboard")))
+            leaderboard_channel = bot.leaderboard_channel
             if not leaderboard_channel:
                 return
 
@@ -589,18 +697,7 @@ async def send_leaderboard():
             if not permissions.send_messages or not permissions.embed_links:
                 return
 
-            df = pd.DataFrame.from_dict(current_data, orient="index")
-            df.reset_index(inplace=True)
-            df.columns = ["Account Name", "Money In Account", "Investopedia Link", "Stocks Invested In"]
-            df.sort_values(by="Money In Account", ascending=False, inplace=True)
-
-            top_users = df.head(5)
-            description = ""
-            for idx, row in enumerate(top_users.iterrows(), 1):
-                _, row = row
-                money = float(row['Money In Account'])
-                description += f"**#{idx} - {row['Account Name']}**\n"
-                description += f"Money: ${money:,.2f}\n\n"
+            description = format_top_users(top_users)
 
             embed = discord.Embed(
                 colour=get_embed_color(),
@@ -609,7 +706,7 @@ async def send_leaderboard():
                 timestamp=get_pst_time(),
             )
 
-            graph_buffer = generate_leaderboard_graph(top_users)
+            graph_buffer = await asyncio.to_thread(generate_leaderboard_graph, top_users)
             if graph_buffer:
                 file = discord.File(graph_buffer, filename="leaderboard_graph.png")
                 embed.set_image(url="attachment://leaderboard_graph.png")
@@ -623,8 +720,7 @@ async def send_leaderboard():
 
                 await leaderboard_channel.send(embed=embed, file=file)
 
-            async with aiofiles.open(snapshot_path, 'w') as f:
-                await f.write(json.dumps(current_data))
+            await asyncio.to_thread(write_json, snapshot_path, current_data)
 
     except Exception as e:
         print(f"Error in send_leaderboard task: {str(e)}")
@@ -632,14 +728,14 @@ async def send_leaderboard():
         traceback.print_exc()
 
 #Background task to create a snapshot of the leaderboard at the start of each trading day (9:30 AM EST).
-@tasks.loop(time=datetime.time(hour=9, minute=30, tzinfo=EST))
+@tasks.loop(time=MARKET_OPEN.replace(tzinfo=EST))
 async def start_of_day():
     now = datetime.datetime.now(EST)
     if now.weekday() < 5:
         await create_morning_snapshot()
 
 #Background task to send a daily summary at the end of the trading day (4:00 PM EST).  Compares the morning snapshot to the end-of-day data.
-@tasks.loop(time=datetime.time(hour=16, minute=0, tzinfo=EST))
+@tasks.loop(time=MARKET_CLOSE.replace(tzinfo=EST))
 async def send_daily_summary():
     now = datetime.datetime.now(EST)
     if now.weekday() < 5:
@@ -648,15 +744,13 @@ async def send_daily_summary():
             if not os.path.exists(morning_snapshot_path):
                 return
 
-            with open(morning_snapshot_path, "r") as f:
-                morning_data = json.load(f)
+            morning_data = await asyncio.to_thread(read_json, morning_snapshot_path)
 
-            with open(LEADERBOARD_LATEST, "r") as f:
-                current_data = json.load(f)
+            current_data = await asyncio.to_thread(load_leaderboard)
 
             stats = calculate_daily_performance(morning_data, current_data)
 
-            if stats["performance"]:
+            if stats["top_performers"]:
                 embed = discord.Embed(
                     colour=get_embed_color(),
                     title="📊 End of Day Trading Summary",
@@ -670,20 +764,10 @@ async def send_daily_summary():
                     inline=False,
                 )
 
-                top_text = "\n".join(
-                    [
-                        f"**{p['username']}**: {p['change_percent']:+.2f}% (${p['change_amount']:,.2f}) - {p['trades']} trades"
-                        for p in stats["performance"][:3]
-                    ]
-                )
+                top_text = "\n".join(map(format_performer, stats["top_performers"]))
                 embed.add_field(name="🏆 Top Performers", value=top_text, inline=False)
 
-                bottom_text = "\n".join(
-                    [
-                        f"**{p['username']}**: {p['change_percent']:+.2f}% (${p['change_amount']:,.2f}) - {p['trades']} trades"
-                        for p in stats["performance"][-3:]
-                    ]
-                )
+                bottom_text = "\n".join(map(format_performer, stats["bottom_performers"]))
                 embed.add_field(
                     name="📉 Needs Improvement", value=bottom_text, inline=False
                 )
@@ -703,18 +787,14 @@ async def send_daily_summary():
                     )
 
                 active_text = "\n".join(
-                    [
-                        f"**{p['username']}**: {p['trades']} trades"
-                        for p in stats["most_active"]
-                    ]
+                    f"**{p['username']}**: {p['trades']} trades"
+                    for p in stats["most_active"]
                 )
                 embed.add_field(
                     name="⚡ Most Active Traders", value=active_text, inline=False
                 )
 
-                channel = bot.get_channel(
-                    int(os.environ.get("DISCORD_CHANNEL_ID_Leaderboard"))
-                )
+                channel = bot.leaderboard_channel
                 if channel:
                     await channel.send(embed=embed)
 
@@ -729,114 +809,84 @@ async def before_daily_summary():
 #Asynchronous function to create a snapshot of the leaderboard data at the beginning of the day.
 async def create_morning_snapshot():
     try:
-        with open(LEADERBOARD_LATEST, "r") as f:
-            data = json.load(f)
+        data = await asyncio.to_thread(load_leaderboard)
 
-        with open(MORNING_SNAPSHOT_PATH, "w") as f:
-            json.dump(data, f)
+        await asyncio.to_thread(write_json, MORNING_SNAPSHOT_PATH, data)
 
     except Exception as e:
         print(f"Error creating morning snapshot: {e}")
 
+#Function to format one line of the daily summary's top/bottom performer lists.
+def format_performer(p):
+    return f"**{p['username']}**: {p['change_percent']:+.2f}% (${p['change_amount']:,.2f}) - {p['trades']} trades"
+
 #Function to calculate various daily performance metrics (top/bottom performers, biggest gain/loss, most active traders).
 def calculate_daily_performance(morning_data, current_data):
     stats = {
-        "performance": [],
+        "top_performers": [],
+        "bottom_performers": [],
         "most_active": [],
         "biggest_gain": {"username": None, "amount": 0, "percent": 0},
         "biggest_loss": {"username": None, "amount": 0, "percent": 0},
         "total_trades": 0
     }
 
-    for username in current_data:
-        if username not in morning_data:
-            continue
-
-        morning_value = float(morning_data[username][0])
-        current_value = float(current_data[username][0])
-
-        change_amount = current_value - morning_value
-        change_percent = (change_amount / morning_value) * 100 if morning_value != 0 else 0
-
-        morning_stocks = set(stock[0] for stock in morning_data[username][2])
-        current_stocks = set(stock[0] for stock in current_data[username][2])
-        trades = len(morning_stocks.symmetric_difference(current_stocks))
-        stats["total_trades"] += trades
-
-        stats["performance"].append({
-            "username": username,
-            "change_amount": change_amount,
-            "change_percent": change_percent,
-            "trades": trades
-        })
-
-        if change_percent > stats["biggest_gain"]["percent"]:
-            stats["biggest_gain"] = {
-                "username": username,
-                "amount": change_amount,
-                "percent": change_percent
-            }
-        if change_percent < stats["biggest_loss"]["percent"]:
-            stats["biggest_loss"] = {
-                "username": username,
-                "amount": change_amount,
-                "percent": change_percent
-            }
-
-        if trades > 0:
-            stats["most_active"].append({
-                "username": username,
-                "trades": trades
-            })
-
-    stats["performance"].sort(key=lambda x: x["change_percent"], reverse=True)
-    stats["most_active"].sort(key=lambda x: x["trades"], reverse=True)
-    stats["most_active"] = stats["most_active"][:3]
-
-    return stats
-
-#Import aiofiles library for asynchronous file I/O operations.
-import aiofiles
-
-#Function to load leaderboard data asynchronously, handling potential errors.
-async def load_leaderboard_data() -> Optional[Dict[str, Any]]:
-    try:
-        if not os.path.exists(LEADERBOARD_LATEST):
-            return None
+    # Per-user results are kept as parallel arrays; dicts are only built for the handful of users that get displayed.
+    usernames = [username for username in current_data if username in morning_data]
+    if not usernames:
+        return stats
 
-        try:
-            async with aiofiles.open(LEADERBOARD_LATEST, mode='r') as f:
-                content = await f.read()
-                return json.loads(content)
-        except ImportError:
-            with open(LEADERBOARD_LATEST, 'r') as f:
-                return json.load(f)
-    except Exception as e:
-        print(f"Error loading leaderboard data: {e}")
-        return None
-
-
-#Function to check if the top 5 rankings have changed between two leaderboard datasets.
-def have_rankings_changed(previous_data, current_data):
-    if not previous_data or not current_data:
-        return True
-
-    prev_rankings = sorted(
-        [(name, float(data[0])) for name, data in previous_data.items()],
-        key=lambda x: x[1],
-        reverse=True
-    )[:5]
-
-    curr_rankings = sorted(
-        [(name, float(data[0])) for name, data in current_data.items()],
-        key=lambda x: x[1],
-        reverse=True
-    )[:5]
-
-    prev_names = [name for name, _ in prev_rankings]
-    curr_names = [name for name, _ in curr_rankings]
+    morning_values = np.fromiter(
+        (float(morning_data[username][0]) for username in usernames), dtype=np.float64, count=len(usernames)
+    )
+    current_values = np.fromiter(
+        (float(current_data[username][0]) for username in usernames), dtype=np.float64, count=len(usernames)
+    )
+    change_amounts = current_values - morning_values
+    change_percents = np.zeros_like(change_amounts)
+    np.divide(change_amounts, morning_values, out=change_percents, where=morning_values != 0)
+    change_percents *= 100
+
+    trade_counts = np.fromiter(
+        (
+            len(get_symbol_set(morning_data[username]) ^ get_symbol_set(current_data[username]))
+            for username in usernames
+        ),
+        dtype=np.int64,
+        count=len(usernames),
+    )
+    stats["total_trades"] = int(trade_counts.sum())
+
+    def entry(i):
+        return {
+            "username": usernames[i],
+            "change_amount": float(change_amounts[i]),
+            "change_percent": float(change_percents[i]),
+            "trades": int(trade_counts[i])
+        }
+
+    stats["top_performers"] = [entry(i) for i in top_k_indices(change_percents, 3)]
+    # Worst performer last, matching the order of the top performers list.
+    stats["bottom_performers"] = [entry(i) for i in bottom_k_indices(change_percents, 3)]
+    active = np.flatnonzero(trade_counts > 0)
+    stats["most_active"] = [entry(i) for i in active[top_k_indices(trade_counts[active], 3)]]
+
+    gain = change_percents.argmax()
+    if change_percents[gain] > 0:
+        stats["biggest_gain"] = {
+            "username": usernames[gain],
+            "amount": float(change_amounts[gain]),
+            "percent": float(change_percents[gain])
+        }
+    loss = change_percents.argmin()
+    if change_percents[loss] < 0:
+        stats["biggest_loss"] = {
+            "username": usernames[loss],
+            "amount": float(change_amounts[loss]),
+            "percent": float(change_percents[loss])
+        }
 
-    return prev_names != curr_names
+    return stats
 
 #Event handler for when the bot is ready.  Starts background tasks and syncs slash commands.  Handles potential errors during startup.
 @bot.event
@@ -844,22 +894,15 @@ async def on_ready():
     try:
         os.makedirs(SNAPSHOTS_DIR, exist_ok=True)
         
-        leaderboard_channel = bot.get_channel(int(os.environ.get("DISCORD_CHANNEL_ID_Leaderboard")))
+        bot.leaderboard_channel = bot.get_channel(LEADERBOARD_CHANNEL_ID)
+        bot.stocks_channel = bot.get_channel(STOCKS_CHANNEL_ID)
+
+        leaderboard_channel = bot.leaderboard_channel
         if leaderboard_channel:
             current_data = await load_leaderboard_data()
             if current_data:
-                df = pd.DataFrame.from_dict(current_data, orient="index")
-                df.reset_index(inplace=True)
-                df.columns = ["Account Name", "Money In Account", "Investopedia Link", "Stocks Invested In"]
-                df.sort_values(by="Money In Account", ascending=False, inplace=True)
-
-                top_users = df.head(5)
-                description = ""
-                for idx, row in enumerate(top_users.iterrows(), 1):
-                    _, row = row
-                    money = float(row['Money In Account'])
-                    description += f"**#{idx} - {row['Account Name']}**\n"
-                    description += f"Money: ${money:,.2f}\n\n"
+                top_users = get_top_users(current_data)
+                description = format_top_users(top_users)
 
                 embed = discord.Embed(
                     colour=get_embed_color(),
@@ -868,7 +911,7 @@ async def on_ready():
                     timestamp=get_pst_time(),
                 )
                 
-                graph_buffer = generate_leaderboard_graph(top_users)
+                graph_buffer = await asyncio.to_thread(generate_leaderboard_graph, top_users)
                 if graph_buffer:
                     file = discord.File(graph_buffer, filename="leaderboard_graph.png")
                     embed.set_image(url="attachment://leaderboard_graph.png")
@@ -0,0 +1,35 @@
+import numpy as np
+
+# Helpers to pick the top/bottom k entries of an array without sorting all of it.  Both match what a stable
+# descending sort followed by [:k] / [-k:] would select and return the indices in that sorted order, so ties keep
+# the order users were encountered in.
+
+
+# Function to order a set of indices the way a stable descending sort of the whole array would.
+def _stable_descending(values, indices):
+    indices = np.sort(indices)
+    return indices[np.argsort(-values[indices], kind="stable")]
+
+
+# Function to get the indices of the k largest values, largest first.  Among tied values the earlier entries win.
+def top_k_indices(values, k):
+    k = min(k, len(values))
+    if k == 0:
+        return np.empty(0, dtype=np.intp)
+    threshold = np.partition(values, len(values) - k)[len(values) - k]
+    above = np.flatnonzero(values > threshold)
+    tied = np.flatnonzero(values == threshold)[:k - len(above)]
+    return _stable_descending(values, np.concatenate((above, tied)))
+
+
+# Function to get the indices of the k smallest values, in descending order (smallest last).  Among tied values the
+# later entries win, the same as taking the tail of a stable descending sort.
+def bottom_k_indices(values, k):
+    k = min(k, len(values))
+    if k == 0:
+        return np.empty(0, dtype=np.intp)
+    threshold = np.partition(values, k - 1)[k - 1]
+    below = np.flatnonzero(values < threshold)
+    tied = np.flatnonzero(values == threshold)
+    tied = tied[len(tied) - (k - len(below)):]
+    return _stable_descending(values, np.concatenate((below, tied)))
@@ -0,0 +1,38 @@
+import os
+import random
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from ranking import bottom_k_indices, top_k_indices
+
+
+def stable_descending_order(values):
+    return sorted(range(len(values)), key=lambda i: values[i], reverse=True)
+
+
+def test_all_tied_top_and_bottom_are_disjoint():
+    values = np.zeros(8)
+    assert top_k_indices(values, 3).tolist() == [0, 1, 2]
+    assert bottom_k_indices(values, 3).tolist() == [5, 6, 7]
+
+
+def test_fewer_values_than_k():
+    values = np.array([1.0, 3.0])
+    assert top_k_indices(values, 3).tolist() == [1, 0]
+    assert bottom_k_indices(values, 3).tolist() == [1, 0]
+    assert top_k_indices(np.array([]), 3).tolist() == []
+    assert bottom_k_indices(np.array([]), 3).tolist() == []
+
+
+def test_matches_stable_sort_with_ties():
+    rng = random.Random(0)
+    for _ in range(3000):
+        values = [rng.choice([-2.0, -1.0, 0.0, 1.0, 2.0]) for _ in range(rng.randint(1, 12))]
+        k = rng.randint(1, 4)
+        order = stable_descending_order(values)
+        array = np.asarray(values)
+        assert top_k_indices(array, k).tolist() == order[:k]
+        assert bottom_k_indices(array, k).tolist() == order[-k:]